@@ -1,8 +1,7 @@
 # neopixel_wyoming_leds.py
-import time
 import board  # For GPIO pins
 import neopixel # For WS2812 control
-import threading
+import numpy as np # For precomputed animation frame tables
 import asyncio
 import logging
 
@@ -23,6 +22,9 @@ COLOR_THINKING = (128, 0, 128)  # Purple for pulsing
 COLOR_SPEAKING = (0, 255, 0)   # Green solid
 COLOR_DISCONNECTED = (255, 0, 0) # Red solid
 
+# --- Animation Parameters ---
+SPIN_TAIL = 3 # Length of the trailing pixels in the listening spinner
+
 class WyomingNeoPixelLEDs:
     """Controls NeoPixel LEDs based on Wyoming Satellite states."""
 
@@ -31,235 +33,460 @@ class WyomingNeoPixelLEDs:
         led_count: int = DEFAULT_LED_COUNT,
         led_pin = DEFAULT_LED_PIN,
         brightness: float = DEFAULT_LED_BRIGHTNESS,
-        pixel_order = DEFAULT_LED_ORDER
+        pixel_order = DEFAULT_LED_ORDER,
+        use_spi: bool = False
     ):
         self.led_count = led_count
         self.led_pin = led_pin
-        self.brightness = brightness
+        self.use_spi = use_spi
+        self._brightness = brightness
         self.pixel_order = pixel_order
         self.pixels: neopixel.NeoPixel | None = None
-        self._animation_thread: threading.Thread | None = None
-        self._stop_animation = False
+        self._spin_frames: np.ndarray | None = None
+        self._spin_frame_bytes: list[memoryview] | None = None
+        self._raw: memoryview | None = None
+        self._pulse_lut: list[tuple[int, int, int]] | None = None
+        self._pulse_payloads: list[memoryview] | None = None
+        self._anim_task: asyncio.Task | None = None
+        self._flash_off_handle: asyncio.TimerHandle | None = None
+        self._stop = asyncio.Event()
+        self._dirty = False # Buffer has changes not yet pushed by show()
+        self._last_fill: tuple[int, int, int] | None = None
 
         self._initialize_pixels()
 
+    @property
+    def brightness(self) -> float:
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, value: float):
+        self._brightness = value
+        # The pulse LUT and raw frame payloads bake the brightness in, so
+        # rebuild them lazily
+        self._pulse_lut = None
+        self._pulse_payloads = None
+        self._spin_frame_bytes = None
+
     def _initialize_pixels(self):
-        """Initializes the NeoPixel strip."""
+        """Initializes the NeoPixel strip.
+
+        Prefers the SPI transport (GPIO10/MOSI) when requested: the SPI
+        peripheral shapes the WS2812 bit stream in hardware, so show() is a
+        plain DMA write (~1% CPU vs ~5% for PWM), the process does not need
+        root, and the PWM/analog-audio conflict goes away. For reliable SPI
+        timing add "spidev.bufsiz=32768" to /boot/cmdline.txt and
+        "core_freq=500" to /boot/config.txt. Falls back to the PWM+DMA
+        driver if SPI initialization fails.
+        """
+        if self.use_spi:
+            try:
+                import neopixel_spi
+                self.pixels = neopixel_spi.NeoPixel_SPI(
+                    board.SPI(),
+                    self.led_count,
+                    brightness=self.brightness,
+                    auto_write=False,
+                    pixel_order=self.pixel_order
+                )
+                _LOGGER.info("NeoPixel strip initialized over SPI (GPIO10/MOSI).")
+            except Exception as e:
+                _LOGGER.warning(f"SPI NeoPixel initialization failed ({e}); falling back to PWM.")
+                self.pixels = None
+
         try:
-            # The NeoPixel library uses rpi_ws281x internally on RPi, using DMA.
-            # auto_write=False means we need to call pixels.show() after setting pixels.
-            self.pixels = neopixel.NeoPixel(
-                self.led_pin,
-                self.led_count,
-                brightness=self.brightness,
-                auto_write=False,
-                pixel_order=self.pixel_order
-            )
-            _LOGGER.info(f"NeoPixel strip initialized with {self.led_count} LEDs on GPIO {self.led_pin}.")
-            # Initially turn off all LEDs
-            self.pixels.fill(COLOR_OFF)
-            self.pixels.show()
+            if self.pixels is None:
+                # The NeoPixel library uses rpi_ws281x internally on RPi, using DMA.
+                # auto_write=False means we need to call pixels.show() after setting pixels.
+                self.pixels = neopixel.NeoPixel(
+                    self.led_pin,
+                    self.led_count,
+                    brightness=self.brightness,
+                    auto_write=False,
+                    pixel_order=self.pixel_order
+                )
+                _LOGGER.info(f"NeoPixel strip initialized with {self.led_count} LEDs on GPIO {self.led_pin}.")
+
+            # Precompute one spin frame per head position. There are only
+            # led_count unique rotations of the faded tail, so building them
+            # all up front means the animation loop just copies a ready-made
+            # buffer instead of doing per-pixel math every frame.
+            self._spin_frames = self._build_spin_frames()
+
+            # Try to grab the driver's raw byte buffer so animation frames
+            # can be blitted with one memcpy instead of per-pixel
+            # __setitem__ calls (each of which re-parses the color and
+            # re-applies brightness scaling).
+            self._raw = self._capture_raw_buffer()
+
+            # Initially turn off all LEDs. No show() here: main() starts an
+            # animation or state right away, so the first flush covers it
+            # and we avoid a redundant full-strip DMA write during boot.
+            self._fill(COLOR_OFF)
 
         except Exception as e:
             _LOGGER.error(f"Error initializing NeoPixels: {e}")
             _LOGGER.error("Ensure libraries are installed, GPIO pin is correct, and you have power/ground connected.")
             self.pixels = None # Disable NeoPixel control if initialization fails
 
-    def _stop_current_animation(self):
-        """Sets the stop flag and waits for the current animation thread to finish."""
-        if self._animation_thread and self._animation_thread.is_alive():
+    def _build_spin_frames(self) -> np.ndarray:
+        """Builds a (led_count, led_count, 3) uint8 table of spinner frames."""
+        n = self.led_count
+        frames = np.zeros((n, n, 3), dtype=np.uint8)
+        color = np.array(COLOR_LISTENING, dtype=np.float64)
+        for head in range(n):
+            for i in range(SPIN_TAIL):
+                # Fade the tail pixels from full brightness down to zero
+                fade_factor = (SPIN_TAIL - i) / SPIN_TAIL
+                frames[head, (head - i) % n] = (color * fade_factor).astype(np.uint8)
+        return frames
+
+    def _capture_raw_buffer(self) -> memoryview | None:
+        """Returns a writable memoryview of the strip's byte buffer, or None.
+
+        The attribute holding the buffer differs between pixelbuf
+        implementations, so probe the known candidates and sanity-check the
+        size. Returning None makes callers fall back to slice assignment.
+        """
+        if any(c not in "RGB" for c in self.pixel_order):
+            return None # RGBW strips keep the per-pixel fallback path
+
+        bpp = len(self.pixel_order)
+        for attr in ("_post_brightness_buffer", "_pre_brightness_buffer", "_buffer", "buf"):
+            candidate = getattr(self.pixels, attr, None)
+            if candidate is None:
+                continue
+            try:
+                view = memoryview(candidate)
+            except TypeError:
+                continue
+            if len(view) == self.led_count * bpp and not view.readonly:
+                return view
+        return None
+
+    def _build_spin_frame_bytes(self) -> list[memoryview]:
+        """Builds zero-copy spinner frame payloads from one doubled template.
+
+        Every head position is just a rotation of the head-0 frame, so a
+        doubled copy of that frame acts as a rolled buffer: the payload for
+        head h is the contiguous window template[n-h : 2n-h] (in pixels).
+        All led_count payloads are memoryview slices sharing one backing
+        buffer, already in the strip's pixel order with the global
+        brightness baked in - no per-head storage, no modulo arithmetic,
+        and still a single memcpy per frame in the animation loop.
+        """
+        perm = ["RGB".index(c) for c in self.pixel_order]
+        bpp = len(perm)
+        n = self.led_count
+
+        # Wire-format head-0 frame with brightness pre-applied
+        base = (self._spin_frames[0].astype(np.float32) * self._brightness).astype(np.uint8)
+        wire0 = base[:, perm].tobytes()
+
+        template = memoryview(bytes(wire0 + wire0))
+        return [template[(n - head) * bpp:(2 * n - head) * bpp] for head in range(n)]
+
+    def _build_pulse_payloads(self) -> list[memoryview]:
+        """Builds pooled wire-format payloads for the pulse LUT entries.
+
+        All payloads live in one preallocated bytearray; the returned
+        memoryview slices are reused for the life of the LUT, so the think
+        animation never allocates on the heap per frame.
+        """
+        if self._pulse_lut is None:
+            self._pulse_lut = self._build_pulse_lut()
+
+        perm = ["RGB".index(c) for c in self.pixel_order]
+        frame_len = self.led_count * len(perm)
+
+        # One backing allocation for every LUT entry
+        pool = bytearray(len(self._pulse_lut) * frame_len)
+        pool_view = memoryview(pool)
+
+        payloads = []
+        brightness = self._brightness
+        for i, color in enumerate(self._pulse_lut):
+            # Bake the global brightness in, as _build_spin_frame_bytes
+            # does: the raw buffer sits after the driver's brightness
+            # stage, so unscaled bytes would render too bright
+            wire = bytes(int(color[p] * brightness) for p in perm) * self.led_count
+            start = i * frame_len
+            pool_view[start:start + frame_len] = wire
+            payloads.append(pool_view[start:start + frame_len])
+        return payloads
+
+    def _build_pulse_lut(self) -> list[tuple[int, int, int]]:
+        """Builds the table of pulsing-purple colors for the think animation.
+
+        With a brightness step of 5 over 0-255 there are only 52 distinct
+        colors, so compute them once instead of three float multiplies plus
+        a tuple allocation every frame. The whole table is produced by one
+        vectorized multiply over the brightness ramp.
+        """
+        # Map 0-255 to 0-1.0 and clamp to the global brightness limit
+        levels = np.arange(0, 256, 5, dtype=np.float32) / 255.0
+        np.minimum(levels, self._brightness, out=levels)
+
+        rgb = np.array(COLOR_THINKING, dtype=np.float32)
+        colors = (rgb[None, :] * levels[:, None]).astype(np.uint8)
+        return [tuple(int(c) for c in row) for row in colors]
+
+    async def _stop_current_animation(self):
+        """Signals the current animation task to stop and waits for it.
+
+        The stop event lets the loop exit cooperatively at its next sleep
+        boundary (at most one frame period away); the cancel covers the
+        case where the task is parked inside asyncio.sleep right now.
+        """
+        if self._flash_off_handle is not None:
+            # Cancel a pending wakeup flash-off so it cannot fire after the
+            # next state was flushed and blank the strip
+            self._flash_off_handle.cancel()
+            self._flash_off_handle = None
+        if self._anim_task and not self._anim_task.done():
             _LOGGER.debug("Stopping current animation...")
-            self._stop_animation = True
-            # Use a timeout in join in case thread is stuck
-            self._animation_thread.join(timeout=1.0)
-            if self._animation_thread.is_alive():
-                _LOGGER.warning("Animation thread did not stop gracefully.")
-            self._stop_animation = False  # Reset flag for the next animation
-            self._animation_thread = None  # Clear reference
-            _LOGGER.debug("Animation stop requested.")
-
-    async def _async_neopixel_fill(self, color):
-        """Helper async function to fill pixels - avoids blocking in asyncio tasks."""
-        if self.pixels:
-            self.pixels.fill(color)
+            self._stop.set()
+            self._anim_task.cancel()
+            try:
+                await self._anim_task
+            except asyncio.CancelledError:
+                pass
+            _LOGGER.debug("Animation stopped.")
+        self._stop.clear()  # Reset for the next animation
+        self._anim_task = None  # Clear reference
+
+    def _fill(self, color):
+        """Fills the buffer, skipping the work if the strip already shows it."""
+        if color == self._last_fill and not self._dirty:
+            return
+        self.pixels.fill(color)
+        self._last_fill = color
+        self._dirty = True
+
+    def _show(self):
+        """Pushes the buffer to the strip if it has pending changes."""
+        if self._dirty:
             self.pixels.show()
-        _LOGGER.debug(f"Pixels filled with {color}")
+            self._dirty = False
+
+    async def _flush(self):
+        """Pushes the pixel buffer to the strip without blocking the loop.
+
+        show() can block for several milliseconds on large strips over
+        non-SPI transports; running it in a worker thread keeps the event
+        loop free to pump Wyoming events. No-op when nothing changed, so
+        redundant state transitions cost nothing.
+        """
+        if not self._dirty:
+            return
+        self._dirty = False
+        await asyncio.to_thread(self.pixels.show)
+
+    def _sync_off(self):
+        """Turns all pixels off without touching animation state."""
+        self._flash_off_handle = None
+        if self.pixels:
+            self._fill(COLOR_OFF)
+            self._show()
+        _LOGGER.debug("Pixels turned off")
 
     # --- Public Methods for LED Effects (Called by event handler) ---
 
-    def off(self):
+    async def off(self):
         """Turns all LEDs off and stops any running animation."""
-        self._stop_current_animation()
+        await self._stop_current_animation()
         if self.pixels:
-            self.pixels.fill(COLOR_OFF)
-            self.pixels.show()
+            self._fill(COLOR_OFF)
+            await self._flush()
         _LOGGER.debug("LED State: Off")
 
-    def wakeup(self):
+    async def wakeup(self):
         """Briefly flashes LEDs white."""
-        self._stop_current_animation()
+        await self._stop_current_animation()
         if self.pixels:
             _LOGGER.debug("LED State: Wakeup (Flash)")
-            self.pixels.fill(COLOR_WAKEUP)
-            self.pixels.show()
-            # Schedule a task to turn them off after a short delay
-            # Need to get the running event loop
-            try:
-                loop = asyncio.get_running_loop()
-                loop.call_soon_threadsafe(
-                    asyncio.create_task, self._async_neopixel_fill(COLOR_OFF)
-                )
-            except RuntimeError:
-                 _LOGGER.warning("Cannot schedule async task from thread. Skipping flash off.")
-                 # If called from a thread where asyncio loop isn't running/accessible
-
-    def listen(self):
-        """Starts a spinning blue animation in a background thread."""
-        self._stop_current_animation()
+            self._fill(COLOR_WAKEUP)
+            await self._flush()
+            # Turn the flash off after a brief, visible delay; a plain
+            # timer callback is much cheaper than spawning a task. Keep the
+            # handle so _stop_current_animation can cancel a pending
+            # flash-off when another state arrives inside the window
+            self._flash_off_handle = asyncio.get_running_loop().call_later(0.1, self._sync_off)
+
+    async def listen(self):
+        """Starts a spinning blue animation as an asyncio task."""
+        await self._stop_current_animation()
         if self.pixels:
             _LOGGER.debug("LED State: Listening (Spin)")
-            # The animation loop is blocking (uses time.sleep), so run it in a thread
-            self._animation_thread = threading.Thread(target=self._listen_animation_thread, daemon=True)
-            self._animation_thread.start()
+            self._anim_task = asyncio.get_running_loop().create_task(self._listen_animation())
 
-    def think(self):
-        """Starts a pulsing purple animation in a background thread."""
-        self._stop_current_animation()
+    async def think(self):
+        """Starts a pulsing purple animation as an asyncio task."""
+        await self._stop_current_animation()
         if self.pixels:
             _LOGGER.debug("LED State: Thinking (Pulse)")
-            # The animation loop is blocking (uses time.sleep), so run it in a thread
-            self._animation_thread = threading.Thread(target=self._think_animation_thread, daemon=True)
-            self._animation_thread.start()
+            self._anim_task = asyncio.get_running_loop().create_task(self._think_animation())
 
-    def speak(self):
+    async def speak(self):
         """Sets LEDs to solid green (simplified)."""
-        self._stop_current_animation()
+        await self._stop_current_animation()
         if self.pixels:
             _LOGGER.debug("LED State: Speaking (Solid)")
-            self.pixels.fill(COLOR_SPEAKING)
-            self.pixels.show()
+            self._fill(COLOR_SPEAKING)
+            await self._flush()
 
-    def disconnected(self):
+    async def disconnected(self):
         """Sets LEDs to solid red."""
-        self._stop_current_animation()
+        await self._stop_current_animation()
         if self.pixels:
             _LOGGER.debug("LED State: Disconnected (Solid Red)")
-            self.pixels.fill(COLOR_DISCONNECTED)
-            self.pixels.show()
+            self._fill(COLOR_DISCONNECTED)
+            await self._flush()
 
-    def cleanup(self):
+    async def cleanup(self):
         """Ensures animations are stopped and LEDs are turned off."""
         _LOGGER.info("Cleaning up NeoPixel LEDs...")
-        self._stop_current_animation()
+        await self._stop_current_animation()
         if self.pixels:
-            self.pixels.fill(COLOR_OFF)
-            self.pixels.show()
+            self._fill(COLOR_OFF)
+            await self._flush()
         _LOGGER.info("NeoPixel cleanup complete.")
 
-    # --- Animation Implementations (Run in separate threads) ---
-    # These methods contain blocking loops (time.sleep) suitable for threads
+    # --- Animation Implementations (Run as asyncio tasks) ---
+    # These coroutines pace themselves with asyncio.sleep so they never
+    # block the event loop, and they exit promptly on task cancellation
 
-    def _listen_animation_thread(self):
-        """Spinning animation loop for a thread."""
+    async def _listen_animation(self):
+        """Spinning animation loop."""
         speed = 0.05 # Animation speed (lower is faster)
         head = 0 # Position of the main "head" of the spinner
-        tail = 3 # Length of the trailing pixels
-
-        _LOGGER.debug("Starting listen animation thread...")
-        while not self._stop_animation:
-            if self.pixels is None: break # Stop if pixels weren't initialized
-
-            # Clear previous frame (optional, depends on animation style)
-            self.pixels.fill(COLOR_OFF)
-
-            # Draw the spinning segment
-            for i in range(tail):
-                # Calculate pixel index wrapping around the strip
-                pixel_index = (head - i + self.led_count) % self.led_count
-                # Fade the tail pixels
-                fade_factor = (tail - i) / tail # Fades from 1.0 to 0.0
-                color = (
-                    int(COLOR_LISTENING[0] * fade_factor),
-                    int(COLOR_LISTENING[1] * fade_factor),
-                    int(COLOR_LISTENING[2] * fade_factor)
-                )
-                self.pixels[pixel_index] = color
-
-            # neopixel library is generally thread-safe for .fill() and .show()
-            # because it prepares the buffer and then sends it via DMA/SPI.
-            self.pixels.show()
-
-            head = (head + 1) % self.led_count # Move the head
-            time.sleep(speed)
 
-        _LOGGER.debug("Listen animation thread stopping.")
-        # Clean up - turn off LEDs when animation stops
-        if self.pixels:
-             self.pixels.fill(COLOR_OFF)
-             self.pixels.show()
-
-
-    def _think_animation_thread(self):
-        """Pulsing brightness animation loop for a thread."""
+        if self.pixels is None:
+            return # Nothing to do if pixels weren't initialized
+
+        # Animation frames overwrite the buffer outside _fill's tracking
+        self._last_fill = None
+        self._dirty = False
+
+        # Hoist attribute lookups out of the loop; LOAD_FAST on a local is
+        # much cheaper than LOAD_ATTR every frame
+        pixels = self.pixels
+        raw = self._raw
+        n = self.led_count
+        sleep = asyncio.sleep
+        stopped = self._stop.is_set
+
+        if raw is not None:
+            # Blit precomputed wire-format bytes straight into the driver
+            # buffer: one C-level memcpy per frame
+            if self._spin_frame_bytes is None:
+                self._spin_frame_bytes = self._build_spin_frame_bytes()
+            frames = self._spin_frame_bytes
+            def blit(frame):
+                raw[:] = frame
+        else:
+            # Fall back to slice assignment through the pixelbuf API
+            frames = self._spin_frames
+            def blit(frame):
+                pixels[:] = frame
+
+        _LOGGER.debug("Starting listen animation...")
+        try:
+            while not stopped():
+                # Copy the precomputed frame for this head position into the
+                # strip, then push it out over DMA
+                blit(frames[head])
+                pixels.show()
+
+                head = (head + 1) % n # Move the head
+                await sleep(speed)
+        finally:
+            _LOGGER.debug("Listen animation stopping.")
+            # Clean up - turn off LEDs when animation stops
+            if self.pixels:
+                self._fill(COLOR_OFF)
+                self._show()
+
+    async def _think_animation(self):
+        """Pulsing brightness animation loop."""
         pulse_speed = 0.02 # Speed of brightness change (lower is faster)
         direction = 1 # 1 for increasing brightness, -1 for decreasing
-        brightness_level = 0 # Current brightness (0-255 range for calculation)
-
-        _LOGGER.debug("Starting think animation thread...")
-        while not self._stop_animation:
-            if self.pixels is None: break # Stop if pixels weren't initialized
-
-            # Calculate color with pulsing brightness
-            # Map 0-255 to 0-1.0 for the neopixel library's fill/set
-            current_brightness = brightness_level / 255.0
-            # Ensure calculated brightness is within the global limit
-            current_brightness = min(current_brightness, self.brightness)
-
-            # Calculate the actual color values based on the pulse brightness
-            pulsing_color = (
-                int(COLOR_THINKING[0] * current_brightness),
-                int(COLOR_THINKING[1] * current_brightness),
-                int(COLOR_THINKING[2] * current_brightness)
-            )
-
-            self.pixels.fill(pulsing_color)
-            self.pixels.show()
-
-            # Update brightness level and direction
-            brightness_level += direction * 5 # Adjust step size (5 here)
-            if brightness_level >= 255:
-                brightness_level = 255
-                direction = -1 # Start decreasing
-            elif brightness_level <= 0:
-                brightness_level = 0
-                direction = 1 # Start increasing
-
-            time.sleep(pulse_speed)
-
-        _LOGGER.debug("Think animation thread stopping.")
-        # Clean up
-        if self.pixels:
-            self.pixels.fill(COLOR_OFF)
-            self.pixels.show()
+        idx = 0 # Current position in the pulse LUT
+
+        if self.pixels is None:
+            return # Nothing to do if pixels weren't initialized
+
+        if self._pulse_lut is None:
+            self._pulse_lut = self._build_pulse_lut()
+
+        # Animation frames overwrite the buffer outside _fill's tracking
+        self._last_fill = None
+        self._dirty = False
+
+        # Hoist attribute lookups out of the loop
+        pixels = self.pixels
+        raw = self._raw
+        sleep = asyncio.sleep
+        stopped = self._stop.is_set
+
+        if raw is not None:
+            # Blit pooled wire-format payloads: one memcpy per frame and
+            # zero per-frame heap allocations
+            if self._pulse_payloads is None:
+                self._pulse_payloads = self._build_pulse_payloads()
+            lut = self._pulse_payloads
+            def paint(entry):
+                raw[:] = entry
+        else:
+            lut = self._pulse_lut
+            def paint(entry):
+                pixels.fill(entry)
+
+        last = len(lut) - 1
+
+        _LOGGER.debug("Starting think animation...")
+        try:
+            while not stopped():
+                # Look up the precomputed frame instead of recomputing it
+                paint(lut[idx])
+                pixels.show()
+
+                # Bounce the index between the two ends of the LUT
+                idx += direction
+                if idx >= last:
+                    idx = last
+                    direction = -1 # Start decreasing
+                elif idx <= 0:
+                    idx = 0
+                    direction = 1 # Start increasing
+
+                await sleep(pulse_speed)
+        finally:
+            _LOGGER.debug("Think animation stopping.")
+            # Clean up
+            if self.pixels:
+                self._fill(COLOR_OFF)
+                self._show()
 
 # Example usage within this file (optional, for testing the class)
-# if __name__ == "__main__":
-#     logging.basicConfig(level=logging.INFO)
+# async def _test():
 #     led_controller = WyomingNeoPixelLEDs(led_count=16, led_pin=board.D18, brightness=0.3)
 #     try:
 #         print("Testing animations...")
-#         led_controller.wakeup()
-#         time.sleep(1)
-#         led_controller.listen()
-#         time.sleep(5)
-#         led_controller.think()
-#         time.sleep(5)
-#         led_controller.speak()
-#         time.sleep(3)
-#         led_controller.disconnected()
-#         time.sleep(3)
-#     except KeyboardInterrupt:
-#         pass
+#         await led_controller.wakeup()
+#         await asyncio.sleep(1)
+#         await led_controller.listen()
+#         await asyncio.sleep(5)
+#         await led_controller.think()
+#         await asyncio.sleep(5)
+#         await led_controller.speak()
+#         await asyncio.sleep(3)
+#         await led_controller.disconnected()
+#         await asyncio.sleep(3)
 #     finally:
-#         led_controller.cleanup()
-#         print("Test finished.")
\ No newline at end of file
+#         await led_controller.cleanup()
+#         print("Test finished.")
+#
+# if __name__ == "__main__":
+#     logging.basicConfig(level=logging.INFO)
+#     asyncio.run(_test())
\ No newline at end of file
@@ -28,6 +28,25 @@ from wyoming.wake import Detection
 
 _LOGGER = logging.getLogger()
 
+# How long to wait for a burst of events to settle before committing the
+# final LED state (Wyoming often sends e.g. VoiceStopped immediately
+# followed by StreamingStopped)
+_COMMIT_DELAY = 0.03
+
+# Map canonical Wyoming event types to the LED state each one requests.
+# The type strings are derived from the event classes so they stay in sync
+# with the wyoming package; a single dict lookup replaces the seven-way
+# is_type() chain that ran on every event.
+_DISPATCH: dict[str, str] = {
+    Detection().event().type: "wakeup",
+    VoiceStarted().event().type: "speak",          # Emulate speaking state
+    VoiceStopped().event().type: "think",          # Assume a processing/thinking state
+    StreamingStopped().event().type: "off",        # Idle after streaming stops
+    SatelliteConnected().event().type: "off",      # Initial sequence handled in main()
+    Played().event().type: "speak",                # Emulate speaking during playback
+    SatelliteDisconnected().event().type: "disconnected",  # Solid red
+}
+
 # Global instance of our LED controller
 # This makes it accessible within the EventHandler instance
 led_controller: WyomingNeoPixelLEDs | None = None
@@ -60,30 +79,50 @@ async def main() -> None:
         )
         # Emulate the initial pixel_ring startup sequence
         if led_controller.pixels is not None: # Only if initialization was successful
-             led_controller.think() # Pulsing purple
+             await led_controller.think() # Pulsing purple
              await asyncio.sleep(3)
-             led_controller.off()
+             await led_controller.off()
 
     except Exception as e:
         _LOGGER.error(f"Failed to initialize LED controller: {e}")
         # led_controller remains None, the event handler will check
 
+    # Install signal handlers on the running loop so SIGINT/SIGTERM stop
+    # the server promptly and LED cleanup runs while the loop is alive
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
     # Start server
     server = AsyncServer.from_uri(args.uri)
 
+    # Pass the led_controller instance to the event handler constructor
+    server_task = asyncio.create_task(
+        server.run(partial(LEDsEventHandler, args, led_controller=led_controller))
+    )
+    stop_task = asyncio.create_task(stop.wait())
+
     try:
-        # Pass the led_controller instance to the event handler constructor
-        await server.run(partial(LEDsEventHandler, args, led_controller=led_controller))
-    except asyncio.CancelledError:
-        _LOGGER.info("Server task cancelled.")
-    except KeyboardInterrupt:
-         # Handled by outer asyncio.run wrapper
-         pass
+        await asyncio.wait({server_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+        if not server_task.done():
+            _LOGGER.info("Received termination signal. Initiating graceful shutdown.")
+            server_task.cancel()
+            try:
+                await server_task
+            except asyncio.CancelledError:
+                _LOGGER.info("Server task cancelled.")
+        else:
+            # Server finished on its own (e.g. bad --uri or bind failure):
+            # await it so the exception propagates to __main__ instead of
+            # being swallowed by asyncio.wait
+            await server_task
     finally:
+        stop_task.cancel()
         _LOGGER.info("Server stopped.")
         # Ensure LEDs are off on exit using the controller's cleanup method
         if led_controller:
-            led_controller.cleanup()
+            await led_controller.cleanup()
 
 
 class LEDsEventHandler(AsyncEventHandler):
@@ -102,11 +141,60 @@ class LEDsEventHandler(AsyncEventHandler):
         self.client_id = str(time.monotonic_ns())
         self.led_controller = led_controller # Store the instance
 
+        # Debounce state: only the last state requested within
+        # _COMMIT_DELAY is actually applied to the LEDs
+        self._pending: str | None = None
+        self._commit_handle: asyncio.TimerHandle | None = None
+        self._commit_task: asyncio.Task | None = None
+
         _LOGGER.debug("Client connected: %s", self.client_id)
 
+    def _request_state(self, state: str) -> None:
+        """Remembers the requested LED state and (re)arms the commit timer.
+
+        Bursts of events collapse into a single animation change and a
+        single strip update instead of one per event.
+        """
+        self._pending = state
+        if self._commit_handle is not None:
+            self._commit_handle.cancel()
+        self._commit_handle = asyncio.get_running_loop().call_later(
+            _COMMIT_DELAY, self._commit
+        )
+
+    def _commit(self) -> None:
+        """Applies the last requested LED state."""
+        self._commit_handle = None
+        state = self._pending
+        self._pending = None
+        if state is None:
+            return
+
+        _LOGGER.debug("Committing LED state: %s", state)
+        method = getattr(self.led_controller, state)
+        previous = self._commit_task
+
+        async def apply() -> None:
+            # Chain on the previous commit so two state changes can never
+            # interleave inside the controller's stop/start sequence and
+            # orphan a running animation
+            if previous is not None:
+                await previous
+            try:
+                await method()
+            except Exception:
+                _LOGGER.exception("Error applying LED state '%s'", state)
+
+        # Keeping the reference also protects the task from being
+        # garbage-collected mid-flight
+        self._commit_task = asyncio.get_running_loop().create_task(apply())
+
     async def handle_event(self, event: Event) -> bool:
         """Handle an event from the client."""
-        _LOGGER.debug("Received event: %s", event)
+        # Guard so the (potentially large) event repr is never built when
+        # debug logging is filtered out - this runs for every audio chunk
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received event: %s", event)
 
         # Use the stored led_controller instance to call methods
         # Check if the controller was initialized successfully
@@ -114,54 +202,15 @@ class LEDsEventHandler(AsyncEventHandler):
             _LOGGER.debug("LED controller not available. Skipping LED update.")
             return True # Still process the Wyoming event
 
-        if Detection.is_type(event.type):
-            _LOGGER.info("Event: Detection")
-            self.led_controller.wakeup()
-        elif VoiceStarted.is_type(event.type):
-            _LOGGER.info("Event: VoiceStarted")
-            self.led_controller.speak() # Emulate speaking state
-        elif VoiceStopped.is_type(event.type):
-            _LOGGER.info("Event: VoiceStopped")
-            # After voice stopped, often returns to listening/thinking or off
-            # Let's assume it might go into a "processing/thinking" state
-            self.led_controller.think() # Emulate thinking state
-        elif StreamingStopped.is_type(event.type):
-            _LOGGER.info("Event: StreamingStopped")
-            # After streaming stops, it should go idle
-            self.led_controller.off() # Turn off LEDs
-        elif SatelliteConnected.is_type(event.type):
-            _LOGGER.info("Event: SatelliteConnected")
-            # Initial connection sequence - handled in main() init
-            # Subsequent connections might warrant a different indicator, or just off
-            self.led_controller.off()
-
-        elif Played.is_type(event.type):
-            _LOGGER.info("Event: Played (Audio Response)")
-            self.led_controller.speak() # Emulate speaking during playback
-            # The satellite doesn't send a "PlaybackStopped" event usually.
-            # You might need a timer here or rely on a subsequent StreamingStopped/VoiceStopped event.
-            # For now, we'll just show speak color. Subsequent events will change it.
-
-        elif SatelliteDisconnected.is_type(event.type):
-            _LOGGER.info("Event: SatelliteDisconnected")
-            self.led_controller.disconnected() # Show disconnected color (Red)
+        # One O(1) dict lookup instead of a chain of is_type() calls
+        state = _DISPATCH.get(event.type)
+        if state is not None:
+            _LOGGER.info("Event: %s -> LED state '%s'", event.type, state)
+            self._request_state(state)
 
         return True
 
 
-# --- Signal Handling for Clean Exit ---
-def signal_handler(sig, frame):
-    """Handle SIGTERM/SIGINT to perform cleanup."""
-    _LOGGER.info("Received termination signal (%s). Initiating graceful shutdown.", sig)
-    # Stop the asyncio event loop
-    loop = asyncio.get_event_loop()
-    loop.call_soon_threadsafe(loop.stop) # Signal the event loop to stop
-
-# Register signal handlers
-signal.signal(signal.SIGINT, signal_handler) # Ctrl+C
-signal.signal(signal.SIGTERM, signal_handler) # Sent by systemd etc.
-
-
 if __name__ == "__main__":
     # Configure basic logging
     # Change to DEBUG for verbose logs, including LED state changes from the library
@@ -170,18 +219,12 @@ if __name__ == "__main__":
     _LOGGER.info("Starting NeoPixel LED Control Server for Wyoming Satellite...")
 
     try:
-        # Get the current event loop or create a new one
-        loop = asyncio.get_event_loop()
-        # Run the main async function until completion or interruption
-        loop.run_until_complete(main())
+        # Signal handlers are installed on the running loop inside main();
+        # LED cleanup happens there too, while the loop is still alive
+        asyncio.run(main())
     except KeyboardInterrupt:
         _LOGGER.info("Keyboard interrupt received, shutting down.")
-    except Exception as e:
+    except Exception:
         _LOGGER.exception("An unhandled error occurred.")
     finally:
-         _LOGGER.info("Event loop finished.")
-         # Final cleanup - ensure LEDs are off and animation thread is stopped
-         # This is also handled within the main() finally block, but good practice.
-         if led_controller:
-             led_controller.cleanup()
-         _LOGGER.info("Script exiting.")
\ No newline at end of file
+        _LOGGER.info("Script exiting.")
\ No newline at end of file
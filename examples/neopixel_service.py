@@ -4,10 +4,15 @@ import argparse
 import asyncio
 import logging
 import time
-from functools import partial
+from functools import lru_cache, partial
 
 from typing import Any
 
+try:
+    import board  # type: ignore
+except ImportError:  # pragma: no cover - import error is surfaced to user
+    board = None
+
 from wyoming.event import Event
 from wyoming.satellite import (
     SatelliteConnected,
@@ -24,7 +29,29 @@ from wyoming_satellite.neopixel_ring import NeoPixelRing
 
 _LOGGER = logging.getLogger(__name__)
 
-
+# Event types grouped by the ring action they share. The type strings are
+# derived from the event classes so they stay in sync with the wyoming
+# package, and the frozensets keep the dispatch table below free of
+# duplicated actions when several events map to the same behaviour.
+_WAKEUP_EVENTS = frozenset({Detection().event().type})
+_SPEAK_EVENTS = frozenset({VoiceStarted().event().type, StreamingStarted().event().type})
+_SPIN_EVENTS = frozenset({VoiceStopped().event().type})
+_THINK_EVENTS = frozenset({SatelliteConnected().event().type})
+_OFF_EVENTS = frozenset({StreamingStopped().event().type, Played().event().type})
+_DISCONNECTED_EVENTS = frozenset({SatelliteDisconnected().event().type})
+
+# One O(1) lookup per event in handle_event
+_DISPATCH = {
+    **dict.fromkeys(_WAKEUP_EVENTS, lambda ring: ring.wakeup()),
+    **dict.fromkeys(_SPEAK_EVENTS, lambda ring: ring.speak()),
+    **dict.fromkeys(_SPIN_EVENTS, lambda ring: ring.spin()),
+    **dict.fromkeys(_THINK_EVENTS, lambda ring: ring.think(duration=2.0)),
+    **dict.fromkeys(_OFF_EVENTS, lambda ring: ring.off()),
+    **dict.fromkeys(_DISCONNECTED_EVENTS, lambda ring: ring.mono(0xFF0000)),
+}
+
+
+@lru_cache(maxsize=None)
 def _parse_color(value: str) -> int:
     value = value.strip()
     if value.startswith("#"):
@@ -34,6 +61,7 @@ def _parse_color(value: str) -> int:
     return int(value, 16)
 
 
+@lru_cache(maxsize=None)
 def _resolve_pin(value: str) -> Any:
     """Resolve a command-line pin description to a ``board`` pin object."""
 
@@ -41,10 +69,8 @@ def _resolve_pin(value: str) -> Any:
     if value.lower().startswith("board."):
         value = value.split(".", maxsplit=1)[1]
 
-    try:
-        import board  # type: ignore
-    except ImportError as exc:  # pragma: no cover - import error is surfaced to user
-        raise RuntimeError("The 'board' module from adafruit-blinka is required") from exc
+    if board is None:
+        raise RuntimeError("The 'board' module from adafruit-blinka is required")
 
     candidates = []
     direct = value
@@ -109,12 +135,14 @@ async def main() -> None:
     _LOGGER.info("Initialising NeoPixel ring")
 
     pin = _resolve_pin(args.pin)
+    primary = _parse_color(args.primary_color)
+    secondary = _parse_color(args.secondary_color)
 
     ring = NeoPixelRing(pin=pin, pixel_count=args.pixels, brightness=args.brightness)
-    ring.set_color_palette(_parse_color(args.primary_color), _parse_color(args.secondary_color))
+    ring.set_color_palette(primary, secondary)
 
     # Show a short boot sequence to indicate the controller is running
-    ring.pulse(_parse_color(args.primary_color), duration=1.0)
+    ring.pulse(primary, duration=1.0)
     await asyncio.sleep(1.0)
     ring.off()
 
@@ -149,32 +177,14 @@ class LEDsEventHandler(AsyncEventHandler):
         _LOGGER.debug("Client connected: %s", self.client_id)
 
     async def handle_event(self, event: Event) -> bool:
-        _LOGGER.debug(event)
-
-        if Detection.is_type(event.type):
-            _LOGGER.debug("Detection")
-            self.ring.wakeup()
-        elif VoiceStarted.is_type(event.type):
-            _LOGGER.debug("VoiceStarted")
-            self.ring.speak()
-        elif VoiceStopped.is_type(event.type):
-            _LOGGER.debug("VoiceStopped")
-            self.ring.spin()
-        elif StreamingStarted.is_type(event.type):
-            _LOGGER.debug("StreamingStarted")
-            self.ring.speak()
-        elif StreamingStopped.is_type(event.type):
-            _LOGGER.debug("StreamingStopped")
-            self.ring.off()
-        elif SatelliteConnected.is_type(event.type):
-            _LOGGER.debug("SatelliteConnected")
-            self.ring.think(duration=2.0)
-        elif Played.is_type(event.type):
-            _LOGGER.debug("Played")
-            self.ring.off()
-        elif SatelliteDisconnected.is_type(event.type):
-            _LOGGER.debug("SatelliteDisconnected")
-            self.ring.mono(0xFF0000)
+        # Guard so the event repr is never built when debug logging is off
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(event)
+
+        action = _DISPATCH.get(event.type)
+        if action is not None:
+            _LOGGER.debug(event.type)
+            action(self.ring)
 
         return True
 
@@ -4,16 +4,100 @@ The API mirrors the external ``pixel_ring`` package that is used by the
 ``usbmic_service.py`` example but adapts the behaviour for a 12 pixel
 WS2812A ring that is commonly bundled with Google Voice HAT style
 hardware.
+
+Callers that decode whole colour tables (gradients, per-pixel palettes
+supplied as ``0xRRGGBB`` ints) should use :func:`ints_to_rgb_array`
+rather than converting one colour at a time.
 """
 from __future__ import annotations
 
+import logging
+import queue
 import threading
 import time
 from dataclasses import dataclass
-from typing import Callable, Iterable, List, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Union, cast
+
+_LOGGER = logging.getLogger()
 
 RGBColor = Tuple[int, int, int]
 
+try:
+    # Optional acceleration: vectorise the numeric frame loops when numpy
+    # is installed on the host
+    import numpy as np
+
+    _HAVE_NUMPY = True
+except ImportError:
+    _HAVE_NUMPY = False
+
+try:
+    # Further optional acceleration: JIT-compile the loops with numba
+    from numba import njit
+
+    _HAVE_NUMBA = _HAVE_NUMPY
+except ImportError:
+    _HAVE_NUMBA = False
+
+try:
+    # Optional compiled accelerator: a Cython (or similar) build of the
+    # frame packer can be dropped in as this module's ``_fast`` sibling;
+    # the pure-Python packer in NeoPixelRing._pack_frame is the fallback
+    from wyoming_satellite._neopixel_ring_fast import pack_frame as _pack_frame_fast  # type: ignore
+except ImportError:
+    _pack_frame_fast = None
+
+try:
+    # On MicroPython builds (where numpy/numba are unavailable) the native
+    # emitter compiles the integer helpers below to machine code. The
+    # emitters only apply to module-level functions, which is why the
+    # scalar frame maths lives outside the class.
+    import micropython  # type: ignore
+
+    _native = micropython.native
+except ImportError:
+    # CPython: plain no-op decorator
+    def _native(func):
+        return func
+
+
+if _HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _think_frame_nb(step: int, n: int, sr: int, sg: int, sb: int, out) -> None:
+        offset = step % n
+        half = n / 2
+        for index in range(n):
+            distance = (index - offset) % n
+            fade = 1.0 - distance / half
+            if fade < 0.0:
+                fade = 0.0
+            factor = fade * 0.5
+            out[index, 0] = int(sr * factor)
+            out[index, 1] = int(sg * factor)
+            out[index, 2] = int(sb * factor)
+
+    @njit(cache=True)
+    def _pulse_frame_nb(level: float, r: int, g: int, b: int, out) -> None:
+        for index in range(out.shape[0]):
+            out[index, 0] = int(r * level)
+            out[index, 1] = int(g * level)
+            out[index, 2] = int(b * level)
+
+
+# Shared "off" pixel: every dark pixel in every cached frame references
+# this one tuple instead of allocating its own
+_OFF: RGBColor = (0, 0, 0)
+
+# One pulse cycle's worth of brightness levels (triangle wave over 40 steps)
+_PULSE_CYCLE = 40
+_PULSE_LEVELS: Tuple[float, ...] = tuple(
+    phase / (_PULSE_CYCLE / 2)
+    if phase < _PULSE_CYCLE / 2
+    else 1 - ((phase - (_PULSE_CYCLE / 2)) / (_PULSE_CYCLE / 2))
+    for phase in range(_PULSE_CYCLE)
+)
+
 
 @dataclass(slots=True)
 class Palette:
@@ -32,9 +116,43 @@ def _int_to_rgb(value: int) -> RGBColor:
     return (red, green, blue)
 
 
+def ints_to_rgb_array(values: Sequence[int]) -> "Union[np.ndarray, List[RGBColor]]":
+    """Convert many ``0xRRGGBB`` colours in one pass.
+
+    Batch companion to the per-colour conversion: with numpy installed
+    the channel extraction runs as three vectorised bit ops over a
+    contiguous array and an ``(n, 3)`` uint8 array is returned;
+    otherwise a list of ``(r, g, b)`` tuples. Palette-heavy callers
+    (gradients, per-pixel colour tables) should prefer this over calling
+    a converter once per colour.
+    """
+
+    if _HAVE_NUMPY:
+        arr = np.asarray(values, dtype=np.uint32)
+        return np.stack(((arr >> 16) & 0xFF, (arr >> 8) & 0xFF, arr & 0xFF), axis=-1).astype(
+            np.uint8
+        )
+
+    return [_int_to_rgb(int(value)) for value in values]
+
+
 def _ensure_rgb(value: int | Sequence[int]) -> RGBColor:
     """Validate and normalise a colour specification."""
 
+    # Exact type checks first: in practice callers pass int, tuple, or
+    # list, and these avoid the ABC registry walk isinstance(Sequence)
+    # performs. The casts only inform mypy; type() has already proven them.
+    kind = type(value)
+    if kind is int:
+        return _int_to_rgb(cast(int, value))
+
+    if kind is tuple or kind is list:
+        seq = cast(Sequence[int], value)
+        if len(seq) != 3:
+            raise ValueError("RGB sequences must contain exactly three items")
+        return (int(seq[0]), int(seq[1]), int(seq[2]))
+
+    # Fall back to the general checks for sequence/int subclasses
     if isinstance(value, Sequence) and not isinstance(value, (bytes, bytearray)):
         if len(value) != 3:
             raise ValueError("RGB sequences must contain exactly three items")
@@ -46,6 +164,37 @@ def _ensure_rgb(value: int | Sequence[int]) -> RGBColor:
     raise TypeError("Colour must be an int or a sequence of three integers")
 
 
+@_native
+def _scale_rgb(r: int, g: int, b: int, f: int) -> RGBColor:
+    """Scale one colour by an 8.8 fixed-point factor ``f``."""
+
+    return ((r * f) >> 8, (g * f) >> 8, (b * f) >> 8)
+
+
+@_native
+def _think_colors(step: int, n: int, sr: int, sg: int, sb: int) -> List[RGBColor]:
+    """Compute one frame of the think animation in pure Python.
+
+    This is the path taken when numpy/numba are unavailable, i.e. on
+    embedded interpreters, so it is the one worth native-compiling.
+    """
+
+    offset = step % n
+    half = n / 2
+    # Preallocate and index-assign: no list-resize reallocations and the
+    # trailing dark pixels keep the shared _OFF reference
+    colors: List[RGBColor] = [_OFF] * n
+    for index in range(n):
+        distance = (index - offset) % n
+        fade = 1.0 - distance / half
+        if fade < 0.0:
+            continue
+        # fade * 0.5 in 8.8 fixed point
+        f = int(fade * 128)
+        colors[index] = ((sr * f) >> 8, (sg * f) >> 8, (sb * f) >> 8)
+    return colors
+
+
 class NeoPixelRing:
     """Convenience helper around :class:`neopixel.NeoPixel`.
 
@@ -74,10 +223,52 @@ class NeoPixelRing:
 
         self._pixels = neopixel.NeoPixel(pin, pixel_count, **kwargs)
         self._pixel_count = pixel_count
+        self._brightness = brightness
+        self._byte_order: str = pixel_order or str(getattr(self._pixels, "byteorder", "GRB"))
+        self._raw = self._capture_raw_buffer()
         self._palette = Palette(primary=_int_to_rgb(0x0080FF), secondary=_int_to_rgb(0x007A37))
-        self._effect_thread: threading.Thread | None = None
+        if _HAVE_NUMPY:
+            # Static index vector plus shared scratch arrays: the
+            # vectorised and JIT generators all write into _frame in
+            # place, so building a cache entry allocates no ndarrays
+            self._idx = np.arange(pixel_count, dtype=np.int32)
+            self._frame = np.zeros((pixel_count, 3), dtype=np.uint8)
+            self._dist = np.empty(pixel_count, dtype=np.int32)
+            self._fade = np.empty(pixel_count, dtype=np.float32)
+        self._buf_view: "np.ndarray | None" = None
+        if _HAVE_NUMPY and self._raw is not None:
+            # ndarray view of the raw byte buffer plus the channel
+            # permutation, so a frame of colour tuples becomes one scaled
+            # copy into the wire buffer instead of a pixelbuf loop
+            self._buf_view = np.frombuffer(self._raw, dtype=np.uint8).reshape(pixel_count, 3)
+            self._channel_perm = np.array(
+                ["RGB".index(channel) for channel in self._byte_order], dtype=np.intp
+            )
+        self._frame_cache: Dict[str, Tuple[Tuple[RGBColor, ...], ...]] = self._build_frame_cache()
+        if _HAVE_NUMBA:
+            # _think_frame_nb compiles while the frame cache is built
+            # above; warm the pulse kernel here too so the first pulse()
+            # does not stall its caller on a cold JIT cache
+            _pulse_frame_nb(_PULSE_LEVELS[0], 0, 0, 0, self._frame)
+        # Whole-ring fill caches, keyed by colour: wire-format payloads
+        # for the raw-buffer path, frame lists for the fallback path
+        self._fill_payloads: Dict[RGBColor, bytes] = {}
+        self._fill_frames: Dict[RGBColor, List[RGBColor]] = {}
+        # Pulse cycles (frames plus optional packed payloads) per colour
+        self._pulse_cache: Dict[
+            RGBColor, Tuple[Tuple[Tuple[RGBColor, ...], ...], Tuple[bytes, ...] | None]
+        ] = {}
         self._stop_event = threading.Event()
-        self._lock = threading.Lock()
+        # Cancellation token: bumped by _stop_effect, checked by the
+        # runner before every frame write, so stopping never blocks
+        self._generation = 0
+        # Serialises pixel-buffer writes between the worker and caller
+        # fills; reentrant so the runner's final fill can nest inside its
+        # own generation check
+        self._pixels_lock = threading.RLock()
+        self._jobs: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run_effects, daemon=True)
+        self._worker.start()
 
     # ------------------------------------------------------------------
     # Public API
@@ -86,16 +277,17 @@ class NeoPixelRing:
         """Set the colours used by the animations."""
 
         self._palette = Palette(primary=_ensure_rgb(primary), secondary=_ensure_rgb(secondary))
+        self._frame_cache = self._build_frame_cache()
 
     def wakeup(self, *, duration: float | None = 2.0) -> None:
         """Show a wake-up animation."""
 
-        self._start_effect(self._wakeup_frame, interval=0.08, duration=duration)
+        self._start_cached("wakeup", interval=0.08, duration=duration)
 
     def think(self, *, duration: float | None = None) -> None:
         """Show a waiting/"thinking" animation."""
 
-        self._start_effect(self._think_frame, interval=0.12, duration=duration)
+        self._start_cached("think", interval=0.12, duration=duration)
 
     def speak(self) -> None:
         """Show a solid colour indicating that speech is being recorded."""
@@ -106,7 +298,7 @@ class NeoPixelRing:
     def spin(self, *, duration: float | None = 1.5) -> None:
         """Show a short spinner animation, useful when processing ends."""
 
-        self._start_effect(self._spin_frame, interval=0.06, duration=duration)
+        self._start_cached("spin", interval=0.06, duration=duration)
 
     def mono(self, color: int | Sequence[int]) -> None:
         """Display a single colour on the whole ring."""
@@ -118,18 +310,33 @@ class NeoPixelRing:
         """Pulse a colour once."""
 
         rgb = _ensure_rgb(color)
-        self._start_effect(lambda step: self._pulse_frame(step, rgb), interval=0.05, duration=duration)
+        # Materialise the full 40-step cycle (and its wire-format
+        # payloads) once per colour so the runner never allocates a frame
+        # while the effect plays and repeat pulses skip the packing pass
+        cached = self._pulse_cache.get(rgb)
+        if cached is None:
+            frames = tuple(self._pulse_frame(step, rgb) for step in range(_PULSE_CYCLE))
+            payloads = None
+            if self._raw is not None:
+                payloads = tuple(self._pack_frame(frame) for frame in frames)
+            cached = (frames, payloads)
+            self._pulse_cache[rgb] = cached
+        frames, payloads = cached
+        self._start_effect(frames, interval=0.05, duration=duration, payloads=payloads)
 
     def off(self) -> None:
         """Turn off all LEDs."""
 
         self._stop_effect()
-        self._fill((0, 0, 0))
+        self._fill(_OFF)
 
     def deinit(self) -> None:
         """Stop animations and release the pixel bus."""
 
         self.off()
+        # Shut the effect worker down before releasing the bus
+        self._jobs.put(None)
+        self._worker.join()
         close = getattr(self._pixels, "deinit", None)
         if callable(close):
             close()
@@ -137,98 +344,321 @@ class NeoPixelRing:
     # ------------------------------------------------------------------
     # Animation helpers
     # ------------------------------------------------------------------
+    def _capture_raw_buffer(self) -> "memoryview | None":
+        """Return a writable view of the pixel byte buffer, or ``None``.
+
+        Different pixelbuf implementations keep the buffer under different
+        attribute names, so probe the known candidates and sanity-check
+        the size. ``None`` keeps callers on the slice-assignment path.
+        """
+
+        if any(channel not in "RGB" for channel in self._byte_order):
+            # RGBW strips keep the portable path
+            return None
+
+        expected = self._pixel_count * len(self._byte_order)
+        for attr in ("_post_brightness_buffer", "_pre_brightness_buffer", "_buffer", "buf"):
+            candidate = getattr(self._pixels, attr, None)
+            if candidate is None:
+                continue
+            try:
+                view = memoryview(candidate)
+            except TypeError:
+                continue
+            if len(view) == expected and not view.readonly:
+                return view
+
+        return None
+
+    def _pack_frame(self, colors: Sequence[RGBColor]) -> bytes:
+        """Pack one frame into raw bytes in the strip's channel order."""
+
+        if _pack_frame_fast is not None:
+            return _pack_frame_fast(colors, self._brightness, self._byte_order)
+
+        brightness = self._brightness
+        perm = tuple("RGB".index(channel) for channel in self._byte_order)
+        return bytes(int(color[p] * brightness) for color in colors for p in perm)
+
+    def _build_frame_cache(self) -> Dict[str, Tuple[Tuple[RGBColor, ...], ...]]:
+        """Materialise one full cycle of frames for each palette animation.
+
+        The animations are pure functions of ``step % period`` and the
+        palette, so every distinct frame can be computed up front; the
+        effect runner then only does a tuple lookup per tick. Frames are
+        frozen as tuples whose pixels share the palette and ``_OFF``
+        objects, so a cache is a handful of small tuples, not
+        ``frames * pixels`` fresh triples.
+        """
+
+        if _HAVE_NUMPY:
+            # Refresh the palette array used by the vectorised generators
+            self._secondary_arr = np.array(self._palette.secondary, dtype=np.float32)
+
+        cache = {
+            "wakeup": tuple(self._wakeup_frame(step) for step in range(self._pixel_count * 2)),
+            "think": tuple(self._think_frame(step) for step in range(self._pixel_count)),
+            "spin": tuple(self._spin_frame(step) for step in range(self._pixel_count)),
+        }
+
+        # Pack every cycle to wire format here as well, so triggering an
+        # effect on the event-loop thread is a dict lookup instead of a
+        # pure-Python packing pass over the whole cycle
+        self._payload_cache: Dict[str, Tuple[bytes, ...]] = {}
+        if self._raw is not None:
+            self._payload_cache = {
+                name: tuple(self._pack_frame(frame) for frame in frames)
+                for name, frames in cache.items()
+            }
+
+        return cache
+
+    def _start_cached(self, name: str, *, interval: float, duration: float | None) -> None:
+        """Start one of the palette animations from the prebuilt caches."""
+
+        self._start_effect(
+            self._frame_cache[name],
+            interval=interval,
+            duration=duration,
+            payloads=self._payload_cache.get(name),
+        )
+
     def _start_effect(
         self,
-        frame_generator: Callable[[int], List[RGBColor]],
+        frame_source: Union[Callable[[int], Sequence[RGBColor]], Sequence[Sequence[RGBColor]]],
         *,
         interval: float,
         duration: float | None,
+        payloads: Tuple[bytes, ...] | None = None,
     ) -> None:
         self._stop_effect()
-        self._stop_event.clear()
-
-        def runner() -> None:
-            start = time.monotonic()
-            step = 0
-            while not self._stop_event.is_set():
-                colors = frame_generator(step)
-                self._apply_colors(colors)
-                step += 1
-                if duration is not None and time.monotonic() - start >= duration:
-                    break
-                if self._stop_event.wait(interval):
-                    break
-
-            if not self._stop_event.is_set():
-                self._apply_colors([(0, 0, 0)] * self._pixel_count)
-
-        self._effect_thread = threading.Thread(target=runner, daemon=True)
-        self._effect_thread.start()
 
-    def _stop_effect(self) -> None:
-        if self._effect_thread is None:
-            return
+        raw = self._raw
+        frame_for_step: Callable[[int], Any]
+        present: Callable[[Any], None]
+        if callable(frame_source):
+            frame_for_step = frame_source
+            present = self._apply_colors
+        elif raw is None:
+            # Precomputed cycle of frames: look up instead of recompute
+            frames = frame_source
+            period = len(frames)
+            frame_for_step = lambda step: frames[step % period]  # noqa: E731
+            present = self._apply_colors
+        else:
+            # Raw buffer available: each frame is a single memcpy plus
+            # show(). The palette animations and pulse pass their cached
+            # wire-format payloads in; packing here is only a fallback for
+            # uncached cycles
+            pixels = self._pixels
+            if payloads is None:
+                payloads = tuple(self._pack_frame(frame) for frame in frame_source)
+            period = len(payloads)
+            cycle = payloads
+            frame_for_step = lambda step: cycle[step % period]  # noqa: E731
+
+            def _present_raw(payload: bytes) -> None:
+                raw[:] = payload
+                pixels.show()
+
+            present = _present_raw
+
+        self._jobs.put((frame_for_step, present, interval, duration, self._generation))
+
+    def _run_effects(self) -> None:
+        """Job loop of the persistent effect worker thread.
+
+        One long-lived thread replaces a thread spawn per animation
+        trigger, so starting an effect costs an enqueue instead of stack
+        allocation and thread start-up.
+        """
+
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                # deinit() sentinel
+                break
+            if job[-1] != self._generation:
+                # Superseded while still queued
+                continue
+            self._stop_event.clear()
+            try:
+                self._run_job(*job)
+            except Exception:
+                # A transient driver error (e.g. show() failing on a bus
+                # hiccup) must not kill the worker: later effects would be
+                # dropped silently while jobs pile up in the queue
+                _LOGGER.exception("Unexpected error running LED effect")
+
+    def _run_job(
+        self,
+        frame_for_step: Callable[[int], Any],
+        present: Callable[[Any], None],
+        interval: float,
+        duration: float | None,
+        generation: int,
+    ) -> None:
+        start = time.monotonic()
+        step = 0
+        # Double-buffer style pipelining: the upcoming frame is always
+        # prepared before the inter-frame wait, so the critical path
+        # after each wake-up is just the buffer write + show(). A true
+        # overlap of show() itself would need an asynchronous transfer
+        # the neopixel API does not expose.
+        colors = frame_for_step(step)
+        deadline = start
+        while True:
+            # Re-check the token under the pixel lock so a frame from a
+            # cancelled job can never land on top of a caller's fill
+            with self._pixels_lock:
+                if self._generation != generation:
+                    return
+                present(colors)
+            step += 1
+            colors = frame_for_step(step)
+            now = time.monotonic()
+            if duration is not None and now - start >= duration:
+                break
+            # Deadline-based pacing: frame-computation jitter cannot
+            # accumulate into drift, and an overrunning frame skips the
+            # wait entirely instead of issuing a negative-timeout futex
+            deadline += interval
+            remaining = deadline - now
+            if remaining > 0:
+                self._stop_event.wait(remaining)
+                if self._generation != generation:
+                    return
+
+        with self._pixels_lock:
+            if self._generation == generation:
+                self._fill(_OFF)
 
+    def _stop_effect(self) -> None:
+        # Invalidate the current job and nudge it out of its wait, but do
+        # not wait for it: callers used to stall here for up to a full
+        # frame interval. The runner exits at its next token check, and
+        # the pixel lock keeps its last frame from racing a caller fill.
+        self._generation += 1
         self._stop_event.set()
-        self._effect_thread.join()
-        self._effect_thread = None
-        self._stop_event.clear()
 
     def _fill(self, color: RGBColor) -> None:
-        self._apply_colors([color] * self._pixel_count)
+        # Cache one wire-format payload (or frame) per colour; repeated
+        # fills with the same colour (off, speak, mono) then allocate
+        # nothing
+        with self._pixels_lock:
+            raw = self._raw
+            if raw is not None:
+                # Whole-ring fill is a single memcpy plus show()
+                payload = self._fill_payloads.get(color)
+                if payload is None:
+                    payload = self._pack_frame((color,) * self._pixel_count)
+                    self._fill_payloads[color] = payload
+                raw[:] = payload
+                self._pixels.show()
+                return
+
+            fill = getattr(self._pixels, "fill", None)
+            if fill is not None:
+                # pixelbuf writes the whole strip in one C-level call
+                fill(color)
+                self._pixels.show()
+                return
+
+            frame = self._fill_frames.get(color)
+            if frame is None:
+                frame = [color] * self._pixel_count
+                self._fill_frames[color] = frame
+            self._apply_colors(frame)
 
     def _apply_colors(self, colors: Iterable[RGBColor]) -> None:
-        with self._lock:
-            for index, color in enumerate(colors):
-                if index >= self._pixel_count:
-                    break
-                self._pixels[index] = color
+        colors_list = colors if isinstance(colors, (list, tuple)) else list(colors)
+        if len(colors_list) != self._pixel_count:
+            # Slice assignment requires an exact length match, so pad with
+            # off pixels or truncate as needed (without mutating the input)
+            colors_list = (tuple(colors_list) + (_OFF,) * self._pixel_count)[: self._pixel_count]
+
+        # Writers are serialised by _pixels_lock, which every caller of
+        # this method holds (the runner presents under it, _fill acquires
+        # it). Palette swaps are atomic attribute replacements, so the
+        # runner can never observe a torn frame.
+        if self._buf_view is not None:
+            # Batch write through the ndarray view of the raw buffer:
+            # brightness scale into the shared scratch, permute into the
+            # strip's channel order, one copy, one show()
+            np.multiply(
+                np.asarray(colors_list, dtype=np.float64),
+                self._brightness,
+                out=self._frame,
+                casting="unsafe",
+            )
+            self._buf_view[:] = self._frame[:, self._channel_perm]
             self._pixels.show()
+            return
+
+        # One C-level pass over the whole buffer instead of pixel_count
+        # separate __setitem__ dispatches
+        self._pixels[:] = colors_list
+        self._pixels.show()
 
     # ------------------------------------------------------------------
     # Frame generators
     # ------------------------------------------------------------------
-    def _wakeup_frame(self, step: int) -> List[RGBColor]:
+    def _wakeup_frame(self, step: int) -> Tuple[RGBColor, ...]:
         progress = step % (self._pixel_count * 2)
         lit = min(progress, self._pixel_count)
-        colors: List[RGBColor] = []
-        for index in range(self._pixel_count):
-            if index < lit:
-                colors.append(self._palette.primary)
-            else:
-                colors.append((0, 0, 0))
-        return colors
-
-    def _think_frame(self, step: int) -> List[RGBColor]:
-        offset = step % self._pixel_count
-        colors: List[RGBColor] = []
-        for index in range(self._pixel_count):
-            distance = (index - offset) % self._pixel_count
-            fade = max(0.0, 1.0 - (distance / (self._pixel_count / 2)))
-            colors.append(self._scale_color(self._palette.secondary, fade * 0.5))
-        return colors
-
-    def _spin_frame(self, step: int) -> List[RGBColor]:
+        return (self._palette.primary,) * lit + (_OFF,) * (self._pixel_count - lit)
+
+    def _think_frame(self, step: int) -> Tuple[RGBColor, ...]:
+        if _HAVE_NUMBA:
+            sr, sg, sb = self._palette.secondary
+            _think_frame_nb(step, self._pixel_count, sr, sg, sb, self._frame)
+            return tuple((int(r), int(g), int(b)) for r, g, b in self._frame)
+
+        if _HAVE_NUMPY:
+            # Vectorised ops writing into the shared scratch arrays, so no
+            # intermediate ndarray is allocated per frame
+            n = self._pixel_count
+            dist = self._dist
+            fade = self._fade
+            np.subtract(self._idx, step % n, out=dist)
+            np.mod(dist, n, out=dist)
+            np.multiply(dist, -1.0 / (n / 2), out=fade)
+            fade += 1.0
+            np.clip(fade, 0.0, 1.0, out=fade)
+            fade *= 0.5
+            np.multiply(
+                self._secondary_arr[None, :],
+                fade[:, None],
+                out=self._frame,
+                casting="unsafe",
+            )
+            return tuple((int(r), int(g), int(b)) for r, g, b in self._frame)
+
+        sr, sg, sb = self._palette.secondary
+        return tuple(_think_colors(step, self._pixel_count, sr, sg, sb))
+
+    def _spin_frame(self, step: int) -> Tuple[RGBColor, ...]:
         position = step % self._pixel_count
-        colors: List[RGBColor] = []
-        for index in range(self._pixel_count):
-            if index == position:
-                colors.append(self._palette.primary)
-            else:
-                colors.append((0, 0, 0))
-        return colors
-
-    def _pulse_frame(self, step: int, color: RGBColor) -> List[RGBColor]:
-        cycle = 40
-        phase = step % cycle
-        if phase < cycle / 2:
-            level = phase / (cycle / 2)
-        else:
-            level = 1 - ((phase - (cycle / 2)) / (cycle / 2))
+        return (
+            (_OFF,) * position
+            + (self._palette.primary,)
+            + (_OFF,) * (self._pixel_count - position - 1)
+        )
+
+    def _pulse_frame(self, step: int, color: RGBColor) -> Tuple[RGBColor, ...]:
+        level = _PULSE_LEVELS[step % _PULSE_CYCLE]
+        if _HAVE_NUMBA:
+            _pulse_frame_nb(level, color[0], color[1], color[2], self._frame)
+            return tuple((int(r), int(g), int(b)) for r, g, b in self._frame)
+
         scaled = self._scale_color(color, level)
-        return [scaled] * self._pixel_count
+        return (scaled,) * self._pixel_count
 
     @staticmethod
     def _scale_color(color: RGBColor, factor: float) -> RGBColor:
+        # 8.8 fixed-point scale: one float-to-int conversion for the factor
+        # instead of three float multiplies and truncations per pixel. The
+        # result matches the float version to within one LSB per channel.
+        f = int(factor * 256)
         r, g, b = color
-        return (int(r * factor), int(g * factor), int(b * factor))
+        return _scale_rgb(r, g, b, f)